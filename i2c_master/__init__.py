@@ -13,20 +13,22 @@ import time
 from datetime import datetime as dt, timezone
 import smbus2
 
-from .message_util import pack_message, unpack_message
+from .message_util import calculate_crc8, pack_message, unpack_message
 
 class I2CMaster:
     I2C_BUS_ID  = 1
     I2C_ADDRESS = 0x47
-    WRITE_READ_DELAY_MS = 11
+    WRITE_READ_DELAY_MS = 2     # initial delay before first polling the slave
+    READY_POLL_DELAY_MS = 0.5   # delay between polls of the slave
+    READY_POLL_RETRIES  = 40    # maximum number of polls before giving up
     '''
     I2C master controller.
 
-    NOTE: the WRITE_READ_DELAY_SEC may need adjusting for packet length and reliability.
-          If you're seeing the original command returned, that's because the master is
-          reading the memory buffer before the slave has had a chance to modify it. The
-          solution is to increase the delay time until this stops happening. Also, it
-          may help to increase the I2C baud rate.
+    After writing a command the master waits WRITE_READ_DELAY_MS, then polls the
+    slave's memory buffer until it holds a valid response, i.e., one having a
+    valid length and CRC that is not simply the command still awaiting processing.
+    A quick slave therefore responds in little more than a single transaction,
+    while a slow one is allowed READY_POLL_RETRIES polls.
 
     Args:
         i2c_id:        the I2C bus identifier (default is 1)
@@ -39,6 +41,8 @@ class I2CMaster:
         self._timeset = timeset
         self._fail_on_exception = False
         self._delay_sec = self.WRITE_READ_DELAY_MS / 1000
+        self._ready_poll_sec = self.READY_POLL_DELAY_MS / 1000
+        self._ready_poll_retries = self.READY_POLL_RETRIES
         try:
             print('opening I2C bus {} at address {:#04x}'.format(self._i2c_bus_id, self._i2c_address))
             self._bus = smbus2.SMBus(self._i2c_bus_id)
@@ -81,15 +85,27 @@ class I2CMaster:
         write_msg = smbus2.i2c_msg.write(self._i2c_address, msg_with_addr)
         self._bus.i2c_rdwr(write_msg)
         time.sleep(self._delay_sec)
-        # write register address 0, then read
+        # write register address 0, then read, until the slave's response is ready
         write_addr = smbus2.i2c_msg.write(self._i2c_address, [0x00])
         read_msg = smbus2.i2c_msg.read(self._i2c_address, 64)
-        self._bus.i2c_rdwr(write_addr, read_msg)
-        resp_buf = list(read_msg)
-        if resp_buf and len(resp_buf) >= 2:
-            msg_len = resp_buf[0]
-            if 1 <= msg_len <= 62:
-                return bytes(resp_buf[:msg_len+2])
+        echo = bytes(out_msg)
+        error = None
+        for _ in range(self._ready_poll_retries):
+            try:
+                self._bus.i2c_rdwr(write_addr, read_msg)
+                error = None
+                # slice only the response (length, payload and CRC) from the read buffer
+                msg_len = ord(read_msg.buf[0])
+                if 1 <= msg_len <= 62:
+                    resp = read_msg.buf[:msg_len+2]
+                    # the command itself is returned until the slave has processed it
+                    if resp != echo and calculate_crc8(resp[:-1]) == resp[-1]:
+                        return resp
+            except OSError as e:
+                error = e
+            time.sleep(self._ready_poll_sec)
+        if error:
+            raise error
         raise RuntimeError("bad message length or slave not ready.")
 
     def send_request(self, message):
@@ -97,12 +113,12 @@ class I2CMaster:
         send a message and return the response.
         '''
         if self._enabled:
-            if message.startswith('time set'):
+            if message == 'time set now':
 #               now = dt.now() # as local time
                 now = dt.now(timezone.utc) # as UTC time
                 print('setting time to: {}'.format(now.isoformat()))
                 ts = now.strftime("%Y%m%d-%H%M%S")
-                message = message.replace("now", ts)
+                message = 'time set {}'.format(ts)
             out_msg = pack_message(message)
             try:
                 resp_bytes = self._i2c_write_and_read(out_msg)
@@ -11,6 +11,7 @@
 
 import sys
 import time
+from machine import I2C
 from colorama import Fore, Style
 
 from logger import Logger, Level
@@ -24,10 +25,15 @@ class Configure:
     RadiozoaConfig handling of their disabling/enabling, and setting their
     I2C addresses.
     '''
-    def __init__(self, level=Level.INFO):
+    def __init__(self, level=Level.INFO, i2c_baud_rate=400_000):
         self._log = Logger('config', level=level)
+        self._i2c_baud_rate = i2c_baud_rate
         self._scanner = I2CScanner(i2c_id=1)
+        self._i2c = I2C(1)
         self._default_i2c_address = 0x29
+        # the Device registry is static, so the expected and probed addresses are fixed
+        self._expected_addresses = tuple(d.i2c_address for d in Device.all() if d.impl is not None)
+        self._probe_addresses = (self._default_i2c_address,) + self._expected_addresses
         self._devices = []
         self._radiozoa_config = None
         self._log.info('ready.')
@@ -42,6 +48,35 @@ class Configure:
     def i2cdetect(self, color=Fore.CYAN):
         self._scanner.i2cdetect(color)
 
+    def _scan_addresses(self, addresses):
+        '''
+        Probes only the provided I2C addresses, returning the set that ACK.
+        This avoids a full 0x00-0x7F scan when only a handful are of interest.
+        '''
+        _found = set()
+        for addr in addresses:
+            try:
+                self._i2c.writeto(addr, b'')
+                _found.add(addr)
+            except OSError:
+                pass
+        return _found
+
+    def _scan_and_report(self):
+        '''
+        Probes the expected addresses, updating the device list, returning a
+        tuple of whether the default address is present and a list of any
+        missing sensor addresses.
+        '''
+        _found = self._scan_addresses(self._probe_addresses)
+        self._devices = sorted(_found)
+        _has_default = self._default_i2c_address in _found
+        _missing = [ addr for addr in self._expected_addresses if addr not in _found ]
+        return _has_default, _missing
+
+    def _format_addresses(self, addresses):
+        return [ "0x{:02X}".format(addr) for addr in addresses ]
+
     def configure(self, force=False):
         '''
         Returns True if successful.
@@ -51,49 +86,52 @@ class Configure:
                 self._log.info(Fore.GREEN + "radiozoa sensor configuration… " + Style.BRIGHT + '(forced)')
             else:
                 self._log.info(Fore.GREEN + "radiozoa sensor configuration…")
-            for device in Device.all():
-                self._log.info("device '{}'; impl: {}; I2C address: 0x{:02X}; xshut: {}".format(device.label, device.impl, device.i2c_address, device.xshut))
-            # scan for existing sensors
-            self._devices = self._scanner.scan()
-            for device in self._devices:
-                self._log.info(Style.DIM + '  device: 0x{:02X}'.format(device))
-            _sensor_addresses = [ dev.i2c_address for dev in Device.all() ]
+            if self._log.level <= Level.INFO: # avoid formatting suppressed messages
+                for device in Device.all():
+                    self._log.info("device '{}'; impl: {}; I2C address: 0x{:02X}; xshut: {}".format(device.label, device.impl, device.i2c_address, device.xshut))
+            # probe for existing sensors at only the addresses of interest
+            _has_default, _missing = self._scan_and_report()
+            if self._log.level <= Level.INFO:
+                for device in self._devices:
+                    self._log.info(Style.DIM + '  device: 0x{:02X}'.format(device))
             self._log.info("checking for default address and missing sensors…")
-            _has_default = self._scanner.has_hex_address(self._default_i2c_address)
-            _missing = [ addr for addr in _sensor_addresses if not self._scanner.has_hex_address(addr) ]
             if force or _has_default or _missing:
-                self.i2cdetect(Fore.WHITE)
+                if self._log.level <= Level.DEBUG:
+                    self.i2cdetect(Fore.WHITE)
                 if _has_default:
                     self._log.info(Fore.YELLOW + "found default 0x{:02X} device; reassigning radiozoa addresses…".format(self._default_i2c_address))
                 if _missing:
-                    self._log.info(Fore.YELLOW + "missing sensor addresses: {}".format([ "0x{:02X}".format(addr) for addr in _missing ]))
+                    self._log.info(Fore.YELLOW + "missing sensor addresses: {}".format(self._format_addresses(_missing)))
                 try:
-                    self._radiozoa_config = RadiozoaConfig(i2c_id=1)
-                    self._radiozoa_config.configure()
+                    self._radiozoa_config = RadiozoaConfig(i2c_id=1, i2c_baud_rate=self._i2c_baud_rate)
+                    _ok, _configured = self._radiozoa_config.configure()
 #                   self._radiozoa_config.close()
                 except Exception as e:
                     self._log.error("{} raised during RadiozoaConfig configuration: {}".format(type(e), e))
                     raise
-                # re-scan after configuration
-                self._log.info("re-scanning for radiozoa sensor addresses…")
-                time.sleep_ms(1000)
-                self._devices = self._scanner.scan()
-                _has_default = self._scanner.has_hex_address(self._default_i2c_address)
-                _missing = [ addr for addr in _sensor_addresses if not self._scanner.has_hex_address(addr) ]
-                if _has_default:
-                    self._log.warning("default address 0x{:02X} is still present after configuration.".format(self._default_i2c_address))
-                    self.i2cdetect(Fore.RED)
-                    return False
-                if _missing:
-                    self._log.warning("missing sensor addresses after configuration: {}".format([ "0x{:02X}".format(addr) for addr in _missing ]))
-                    self.i2cdetect(Fore.RED)
-                    return False
+                if _ok and not force:
+                    # every active sensor was confirmed at its new address, so no re-scan needed
+                    self._devices = sorted(_configured)
                 else:
-                    self._log.info(Fore.GREEN + "radiozoa sensor addresses configured successfully.")
+                    # re-scan after configuration
+                    self._log.info("re-scanning for radiozoa sensor addresses…")
+                    time.sleep_ms(1000)
+                    _has_default, _missing = self._scan_and_report()
+                    if _has_default:
+                        self._log.warning("default address 0x{:02X} is still present after configuration.".format(self._default_i2c_address))
+                        self.i2cdetect(Fore.RED)
+                        return False
+                    if _missing:
+                        self._log.warning("missing sensor addresses after configuration: {}".format(self._format_addresses(_missing)))
+                        self.i2cdetect(Fore.RED)
+                        return False
+                self._log.info(Fore.GREEN + "radiozoa sensor addresses configured successfully.")
+                if self._log.level <= Level.DEBUG:
                     self.i2cdetect(Fore.GREEN)
             else:
                 self._log.info(Fore.GREEN + "radiozoa already configured.")
-                self.i2cdetect(Fore.CYAN)
+                if self._log.level <= Level.DEBUG:
+                    self.i2cdetect(Fore.CYAN)
             self._log.info('complete.')
             return True
         except Exception as e:
@@ -13,6 +13,9 @@
 
 class Device:
     _registry = []
+    _by_index = {}
+    _by_label = {} # keyed on upper-cased label
+    _by_i2c   = {}
     '''
     A pseudo-enum for VL53L0X or VL53L1X sensor configuration.
 
@@ -34,7 +37,15 @@ class Device:
 
           d = Device.by_index(3)
           print(d.label)
+
+      Iterate the flattened table, avoiding property access:
+
+          for index, impl, label, i2c_address, xshut in Device.TABLE:
+              print(label, hex(i2c_address), xshut)
     '''
+    # no per-instance __dict__; ignored harmlessly on ports without slots support
+    __slots__ = ('_index', '_impl', '_label', '_i2c_address', '_xshut')
+
     def __init__(self, index, impl, label, i2c_address, xshut):
         self._index = index
         self._impl  = impl
@@ -42,6 +53,9 @@ class Device:
         self._i2c_address = i2c_address
         self._xshut = xshut
         Device._registry.append(self)
+        Device._by_index[index] = self
+        Device._by_label[label.upper()] = self
+        Device._by_i2c[i2c_address] = self
 
     @property
     def index(self):
@@ -87,25 +101,15 @@ class Device:
 
     @classmethod
     def by_index(cls, index):
-        for d in cls._registry:
-            if d._index == index:
-                return d
-        return None
+        return cls._by_index.get(index)
 
     @classmethod
     def by_label(cls, label):
-        key = label.upper()
-        for d in cls._registry:
-            if d._label.upper() == key:
-                return d
-        return None
+        return cls._by_label.get(label.upper())
 
     @classmethod
     def by_i2c(cls, address):
-        for d in cls._registry:
-            if d._i2c_address == address:
-                return d
-        return None
+        return cls._by_i2c.get(address)
 
 #            IDX  IMPL       DIR   ADDR   PIN    WIRE COLOR
 N0  = Device( 0, 'VL53L1X', 'N0',  0x30,  3) # red/grey
@@ -117,4 +121,7 @@ SW5 = Device( 5, 'VL53L1X', 'SW5', 0x35, 37) # blue/white
 W6  = Device( 6, 'VL53L1X', 'W6',  0x36,  0) # grey
 NW7 = Device( 7, 'VL53L1X', 'NW7', 0x37, 43) # white
 
+# flattened (index, impl, label, i2c_address, xshut) rows for use in hot loops
+Device.TABLE = tuple((d._index, d._impl, d._label, d._i2c_address, d._xshut) for d in Device._registry)
+
 #EOF
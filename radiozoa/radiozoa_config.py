@@ -23,23 +23,51 @@ class RadiozoaConfig:
     Configures all VL53L0X sensors on the Radiozoa sensor board to their unique
     I2C addresses by toggling XSHUT pins and setting addresses as specified in
     the Device pseudo-enum.
+
+    The VL53 sensors support Fast-mode Plus (1MHz) but this requires suitably
+    strong pull-ups and short wiring on the bus; the default remains 400kHz.
+
+    Args:
+        i2c_id:         the I2C bus identifier (default is 1)
+        level:          the log level
+        i2c_baud_rate:  the I2C bus frequency (default is 400kHz)
     '''
-    def __init__(self, i2c_id=1, level=Level.INFO):
+    # delays between scans while waiting for a sensor to boot at 0x29; dense
+    # early where most sensors come up, backing off thereafter (~800ms total)
+    _POLL_SCHEDULE_MS = (40, 60, 100, 200, 400)
+    # delays between scans while confirming a sensor has moved to its new address
+    _ADDRESS_POLL_SCHEDULE_MS = (20, 40, 80, 160)
+
+    def __init__(self, i2c_id=1, level=Level.INFO, i2c_baud_rate=400_000):
         self._log = Logger('config', level=level)
         self._i2c_id = i2c_id
         self._default_i2c_address = 0x29
         self._i2c = None
-        self._i2c_baud_rate = 400_000 # default 100,000
+        self._i2c_baud_rate = i2c_baud_rate # default 100,000
         self._xshut_pins = {}
+        # preallocated address-change buffers, final byte set per call
+        self._vl53l1x_addr_buf = bytearray(b'\x00\x01\x00') # register 0x0001, address
+        self._vl53l0x_addr_buf = bytearray(1)
+        # (index, impl, label, i2c_address, xshut) rows for devices with a sensor fitted
+        self._active_devices = tuple(row for row in Device.TABLE if row[1] is not None)
         self._setup_i2c()
         self._setup_pins()
         self._i2c_scanner = I2CScanner(i2c_id=self._i2c_id)
         self._log.info('ready.')
 
     def configure(self):
+        '''
+        Returns a tuple of True if every active sensor was confirmed at 0x29
+        and reassigned, and the set of I2C addresses successfully assigned.
+        '''
         self._shutdown_all_sensors()
-        self._configure_sensor_addresses()
-        self._log.info('all sensor addresses configured.')
+        _configured = self._configure_sensor_addresses()
+        _ok = len(_configured) == len(self._active_devices)
+        if _ok:
+            self._log.info('all sensor addresses configured.')
+        else:
+            self._log.warning('configured {} of {} sensor addresses.'.format(len(_configured), len(self._active_devices)))
+        return _ok, _configured
 
     def reset(self):
         from device import N0
@@ -52,7 +80,7 @@ class RadiozoaConfig:
 
     def _setup_i2c(self):
         self._i2c = I2C(self._i2c_id, freq=self._i2c_baud_rate)
-        self._log.info('I2C{} open.'.format(self._i2c_id))
+        self._log.info('I2C{} open at {}Hz.'.format(self._i2c_id, self._i2c_baud_rate))
 
     def _setup_pins(self):
         '''
@@ -60,11 +88,12 @@ class RadiozoaConfig:
         We set up the pins even a the Device configuration indicates no
         hardware sensor is available for a given slot.
         '''
-        for device in Device.all():
-            if device.impl is not None:
-                pin = Pin(device.xshut, Pin.OUT) # on pyb, OUT_PP
-                self._xshut_pins[device.index] = pin
-                self._log.info("configured XSHUT pin {} for sensor {} on 0x{:02X} as output.".format(device.xshut, device.label, device.i2c_address))
+        _info = self._log.level <= Level.INFO # avoid formatting suppressed messages
+        for index, impl, label, i2c_address, xshut in self._active_devices:
+            pin = Pin(xshut, Pin.OUT) # on pyb, OUT_PP
+            self._xshut_pins[index] = pin
+            if _info:
+                self._log.info("configured XSHUT pin {} for sensor {} on 0x{:02X} as output.".format(xshut, label, i2c_address))
 
     def close(self):
         '''
@@ -74,61 +103,96 @@ class RadiozoaConfig:
 
     def _shutdown_all_sensors(self):
         '''
-        Shuts down all sensors by setting their XSHUT pins LOW.
+        Shuts down all sensors by setting their XSHUT pins LOW. The pins drive
+        independent chips so are all pulled low first, followed by a single
+        settling delay.
         '''
-        for device in Device.all():
-            if device.impl is not None:
-                self._log.info("shutting down sensor {} at XSHUT pin {}…".format(device.label, device.xshut))
-                self._set_xshut(device.index, False)
-                time.sleep_ms(50)
+        _info = self._log.level <= Level.INFO
+        _set_xshut = self._set_xshut
+        for index, impl, label, i2c_address, xshut in self._active_devices:
+            if _info:
+                self._log.info("shutting down sensor {} at XSHUT pin {}…".format(label, xshut))
+            _set_xshut(index, False)
+        time.sleep_ms(50)
         self._log.info('all sensors shut down.\n')
 
     def _configure_sensor_addresses(self):
         '''
         Sequentially brings up each sensor, sets its I2C address, leaving it enabled.
-        '''
-        from vl53l0x import VL53L0X
-        from vl53l1x import VL53L1X
+        Returns the set of I2C addresses successfully assigned.
 
-        _device_delay_ms = 250
-        _scan_delay_ms   = 750
-        
-        for device in Device.all():
-            if device and device.impl is not None:
-                self._log.info("configuring sensor {} at XSHUT pin {}…".format(device.label, device.xshut))
-                self._set_xshut(device.index, True)
-                found = False
-                for i in range(5):
-                    time.sleep_ms(_scan_delay_ms)
-                    self._i2c_scanner.scan()
-                    found = self._i2c_scanner.has_hex_address(0x29)
-                    if found:
+        All sensors boot at 0x29, so only one may be at the default address at
+        a time. What is overlapped is the boot of each sensor with confirming
+        the previous sensor at its new address, both observed by the same scans.
+        '''
+        _configured = set()
+        _info = self._log.level <= Level.INFO
+        # bind once, used repeatedly inside the loop
+        _scan       = self._i2c_scanner.scan
+        _has        = self._i2c_scanner.has_hex_address
+        _set_xshut  = self._set_xshut
+        _sleep      = time.sleep_ms
+        _poll_ms    = RadiozoaConfig._POLL_SCHEDULE_MS
+        _address_poll_ms = RadiozoaConfig._ADDRESS_POLL_SCHEDULE_MS
+        _pending = None # (index, label, i2c_address) awaiting confirmation at its new address
+        for index, impl, label, i2c_address, xshut in self._active_devices:
+            if _info:
+                self._log.info("configuring sensor {} at XSHUT pin {}…".format(label, xshut))
+            # bring up the next sensor while the previous one settles at its new address
+            _set_xshut(index, True)
+            found = False
+            for i, _delay_ms in enumerate(_poll_ms):
+                _sleep(_delay_ms)
+                _scan()
+                if _pending is not None and _has(_pending[2]):
+                    _configured.add(_pending[2])
+                    _pending = None
+                # until the previous sensor is confirmed a response at 0x29 may still be that sensor
+                found = _pending is None and _has(0x29)
+                if found:
+                    if _info:
                         self._log.info(Style.DIM + "[{}] sensor appeared at 0x29.".format(i))
-                        break
-                    else:
-                        self._log.info(Style.DIM + "[{}] waiting for sensor…".format(i))
-                if not found:
-                    self._log.warning("sensor {} did not appear at 0x29.".format(device.label))
-                    continue
-                try:
-                    # create temporary sensor instance at default address
-                    if device.impl == 'VL53L0X':
-                        temp_sensor = VL53L0X(self._i2c, address=0x29)
-                    elif device.impl == 'VL53L1X':
-                        temp_sensor = VL53L1X(self._i2c, address=0x29)
-                    else:
-                        self._log.warning("unknown sensor type {} for device {}".format(device.impl, device.label))
-                        continue
-                    
-                    # change address using sensor's method
-                    self._set_i2c_address(device, device.i2c_address)
-#                   temp_sensor.set_i2c_address(device.i2c_address)
-                    self._log.info("set address for sensor {} to 0x{:02X}".format(device.label, device.i2c_address))
-                    
-                except Exception as e:
-                    self._log.error("{} raised setting address for sensor {}: {}".format(type(e), device.label, e))
-                    sys.print_exception(e)
-                time.sleep_ms(_device_delay_ms)
+                    break
+                elif _info:
+                    self._log.info(Style.DIM + "[{}] waiting for sensor…".format(i))
+            if _pending is not None:
+                # the previous sensor never confirmed: shut it down in case it remains at
+                # 0x29, then check once more for the current sensor at the default address
+                self._log.warning("sensor {} did not appear at 0x{:02X}.".format(_pending[1], _pending[2]))
+                _set_xshut(_pending[0], False)
+                _pending = None
+                _scan()
+                found = _has(0x29)
+            # a skipped sensor is shut down so it cannot answer the next sensor's address write
+            if not found:
+                self._log.warning("sensor {} did not appear at 0x29.".format(label))
+                _set_xshut(index, False)
+                continue
+            if impl != 'VL53L0X' and impl != 'VL53L1X':
+                self._log.warning("unknown sensor type {} for device {}".format(impl, label))
+                _set_xshut(index, False)
+                continue
+            try:
+                # change address directly via register write, no driver instance required
+                self._set_i2c_address(impl, label, i2c_address)
+                if _info:
+                    self._log.info("set address for sensor {} to 0x{:02X}".format(label, i2c_address))
+                _pending = (index, label, i2c_address)
+            except Exception as e:
+                self._log.error("{} raised setting address for sensor {}: {}".format(type(e), label, e))
+                sys.print_exception(e)
+                _set_xshut(index, False)
+        # confirm the last sensor, with nothing left to overlap
+        if _pending is not None:
+            for _delay_ms in _address_poll_ms:
+                _sleep(_delay_ms)
+                _scan()
+                if _has(_pending[2]):
+                    _configured.add(_pending[2])
+                    break
+            else:
+                self._log.warning("sensor {} did not appear at 0x{:02X}.".format(_pending[1], _pending[2]))
+        return _configured
 
     def _set_xshut(self, device_index, value):
         '''
@@ -145,26 +209,28 @@ class RadiozoaConfig:
         else:
             raise RuntimeError('pin not available for device {}.'.format(device_index))
 
-    def _set_i2c_address(self, device, new_addr):
+    def _set_i2c_address(self, impl, label, new_addr):
         '''
         Change I2C address for VL53L0X or VL53L1X sensor.
-        Assumes sensor is available at 0x29.
+        Assumes sensor is available at 0x29. This does not wait for the
+        change to take effect; the caller polls for the new address.
         
-        @param device: Device instance with impl property
+        @param impl:     the sensor implementation, 'VL53L0X' or 'VL53L1X'
+        @param label:    the device label
         @param new_addr: new I2C address
         '''
         current_addr = 0x29
-        if device.impl == 'VL53L1X':
+        if impl == 'VL53L1X':
             # VL53L1X: write to register 0x0001
-            self._i2c.writeto(current_addr, bytearray([0x00, 0x01, new_addr]))
-            time.sleep_ms(50)
-        elif device.impl == 'VL53L0X':
+            self._vl53l1x_addr_buf[2] = new_addr
+            self._i2c.writeto(current_addr, self._vl53l1x_addr_buf)
+        elif impl == 'VL53L0X':
             # VL53L0X: write to register 0x8A
-            self._i2c.writeto_mem(current_addr, 0x8A, bytes([new_addr]))
-            time.sleep_ms(50)
-        elif device.impl is None:
-            self._log.info(Fore.WHITE + "no device at {}.".format(device.label))
+            self._vl53l0x_addr_buf[0] = new_addr
+            self._i2c.writeto_mem(current_addr, 0x8A, self._vl53l0x_addr_buf)
+        elif impl is None:
+            self._log.info(Fore.WHITE + "no device at {}.".format(label))
         else:
-            raise ValueError("unknown sensor type: {}".format(device.impl))
+            raise ValueError("unknown sensor type: {}".format(impl))
 
 #EOF
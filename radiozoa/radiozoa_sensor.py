@@ -10,6 +10,8 @@
 # modified: 2026-02-17
 
 import time
+import micropython
+import asyncio
 from machine import I2C
 from colorama import Fore, Style
 
@@ -18,6 +20,13 @@ from cardinal import Cardinal
 from device import Device
 from vl53l0x import VL53L0X
 from vl53l1x import VL53L1X
+from sensor import Sensor
+
+# result and interrupt clear registers used by _read_raw()
+_VL53L0X_RESULT_RANGE_MM    = 0x1E   # _RESULT_RANGE_STATUS + 10
+_VL53L0X_INTERRUPT_CLEAR    = b'\x0b\x01'
+_VL53L1X_RESULT_RANGE_MM    = 0x0096 # 16 bit register address
+_VL53L1X_INTERRUPT_CLEAR    = b'\x00\x86\x01'
 
 class RadiozoaSensor:
     '''
@@ -34,7 +43,10 @@ class RadiozoaSensor:
     def __init__(self, i2c_id=1, level=Level.INFO):
         self._log = Logger('radiozoa', level=level)
         self._i2c = I2C(i2c_id)
-        self._sensors = {}
+        self._sensors = [None] * len(Device.all()) # indexed by Device index (Cardinal registry position)
+        self._sensor_by_cardinal = {} # for lookups by an explicit Cardinal
+        self._read_table = [None] * len(Device.all()) # per-sensor preallocated read parameters
+        self._raw_distances = [Sensor.OUT_OF_RANGE] * len(Device.all())
         self._is_ranging = False
         self._create_sensors()
         self._distance_offset = 50
@@ -54,18 +66,23 @@ class RadiozoaSensor:
             try:
                 if dev.impl == 'VL53L0X':
                     sensor = VL53L0X(self._i2c, address=dev.i2c_address)
+                    self._read_table[dev.index] = (dev.i2c_address, _VL53L0X_RESULT_RANGE_MM, 8,
+                            _VL53L0X_INTERRUPT_CLEAR, bytearray(2))
                 elif dev.impl == 'VL53L1X':
                     sensor = VL53L1X(self._i2c, address=dev.i2c_address)
+                    self._read_table[dev.index] = (dev.i2c_address, _VL53L1X_RESULT_RANGE_MM, 16,
+                            _VL53L1X_INTERRUPT_CLEAR, bytearray(2))
                 else:
                     sensor = None
-                self._sensors[cardinal] = sensor
+                self._sensors[dev.index] = sensor
+                self._sensor_by_cardinal[cardinal] = sensor
                 self._log.info('sensor {} created.'.format(cardinal.name))
             except Exception as e:
                 self._log.error('{} raised creating sensor {}: {}'.format(type(e), cardinal.name, e))
                 raise
 
     def dump(self):
-        for cardinal, sensor in self._sensors.items():
+        for sensor in self._sensors:
             if sensor:
                 sensor.stop()
 
@@ -75,8 +92,9 @@ class RadiozoaSensor:
         '''
         if not self._is_ranging:
             self._log.info('starting ranging…')
-            for cardinal, sensor in self._sensors.items():
+            for index, sensor in enumerate(self._sensors):
                 if sensor:
+                    cardinal = Cardinal._registry[index]
                     try:
                         sensor.start()
                         self._log.info('sensor {} ranging started.'.format(cardinal.name))
@@ -94,8 +112,9 @@ class RadiozoaSensor:
         '''
         if self._is_ranging:
             self._log.info('stopping ranging…')
-            for cardinal, sensor in self._sensors.items():
+            for index, sensor in enumerate(self._sensors):
                 if sensor:
+                    cardinal = Cardinal._registry[index]
                     try:
                         sensor.stop()
                         self._log.info('sensor {} ranging stopped.'.format(cardinal.name))
@@ -116,18 +135,20 @@ class RadiozoaSensor:
         Returns:
             int: distance in millimeters, or None on error
         '''
-        sensor = self._sensors.get(cardinal)
+        sensor = self._sensor_by_cardinal.get(cardinal)
         if sensor:
             try:
                 dist = max(0, sensor.read() - self._distance_offset)
                 return dist
             except Exception as e:
-                self._log.error('{} raised reading sensor {}: {}'.format(type(e), cardinal.name, e))
+                if self._log.level <= Level.ERROR:
+                    self._log.error('{} raised reading sensor {}: {}'.format(type(e), cardinal.name, e))
                 return Sensor.OUT_OF_RANGE
         else:
             self._log.warning('no sensor for cardinal {}'.format(cardinal.name))
             return Sensor.OUT_OF_RANGE
 
+    @micropython.native
     def get_distances(self, cardinals=None):
         '''
         Returns distance readings for specified cardinal directions, or all eight if no argument.
@@ -140,36 +161,83 @@ class RadiozoaSensor:
             list: List of distances in mm (or Sensor.OUT_OF_RANGE for failed reads), order matches
             Cardinal registry.
         '''
+        _off = self._distance_offset
+        _mx  = max
+        _oor = Sensor.OUT_OF_RANGE
         if cardinals is None:
-            # return all eight distances in registry order
-            distances = []
-            for cardinal in Cardinal._registry:
-                sensor = self._sensors.get(cardinal)
+            # return all eight distances in registry order, by position
+            _sensors = self._sensors
+            distances = [_oor] * len(_sensors)
+            for i in range(len(_sensors)):
+                sensor = _sensors[i]
                 if sensor:
                     try:
-                        dist = max(0, sensor.read() - self._distance_offset)
-                        distances.append(dist)
+                        distances[i] = _mx(0, sensor.read() - _off)
                     except Exception as e:
-                        self._log.error('{} reading sensor {}: {}'.format(type(e), cardinal.name, e))
-                        distances.append(Sensor.OUT_OF_RANGE)
-                else:
-                    distances.append(Sensor.OUT_OF_RANGE)
+                        if self._log.level <= Level.ERROR:
+                            self._log.error('{} reading sensor {}: {}'.format(type(e), Cardinal._registry[i].name, e))
             return distances
-        else:
-            # return only specified cardinals
-            distances = []
-            for cardinal in cardinals:
-                sensor = self._sensors.get(cardinal)
-                if sensor:
-                    try:
-                        dist = max(0, sensor.read() - self._distance_offset)
-                        distances.append(dist)
-                    except Exception as e:
+        _get = self._sensor_by_cardinal.get
+        distances = [_oor] * len(cardinals)
+        for i, cardinal in enumerate(cardinals):
+            sensor = _get(cardinal)
+            if sensor:
+                try:
+                    distances[i] = _mx(0, sensor.read() - _off)
+                except Exception as e:
+                    if self._log.level <= Level.ERROR:
                         self._log.error('{} reading sensor {}: {}'.format(type(e), cardinal.name, e))
-                        distances.append(Sensor.OUT_OF_RANGE)
-                else:
-                    distances.append(Sensor.OUT_OF_RANGE)
-            return distances
+        return distances
+
+    async def get_distances_async(self, timeout_ms=100):
+        '''
+        Returns distance readings for all eight sensors in Cardinal registry order,
+        less the distance offset, as a list reused between calls.
+
+        While ranging continuously this probes each sensor's data-ready status in
+        turn, reading each as its measurement completes and yielding to the event
+        loop between probe passes. A sensor not ready within timeout_ms keeps its
+        previous reading. If not ranging this falls back to get_distances().
+        '''
+        if not self._is_ranging:
+            return self.get_distances()
+        _out = self._raw_distances
+        _sensors = self._sensors
+        _registry = Cardinal._registry
+        _oor = Sensor.OUT_OF_RANGE
+        _pending = []
+        for index, entry in enumerate(self._read_table):
+            if entry is None:
+                _out[index] = _oor
+            else:
+                _pending.append(index)
+        _start = time.ticks_ms()
+        while True:
+            for i in range(len(_pending) - 1, -1, -1):
+                index = _pending[i]
+                try:
+                    if _sensors[index].data_ready():
+                        _out[index] = self._read_raw(index)
+                        _pending.pop(i)
+                except Exception as e:
+                    if self._log.level <= Level.ERROR:
+                        self._log.error('{} reading sensor {}: {}'.format(type(e), _registry[index].name, e))
+                    _out[index] = _oor
+                    _pending.pop(i)
+            if not _pending or time.ticks_diff(time.ticks_ms(), _start) >= timeout_ms:
+                return _out
+            await asyncio.sleep_ms(1)
+
+    def _read_raw(self, index):
+        '''
+        Reads the most recent result of the sensor at index using its preallocated
+        read parameters, re-arms its interrupt and returns the distance less offset.
+        '''
+        address, register, addrsize, clear_msg, buf = self._read_table[index]
+        self._i2c.readfrom_mem_into(address, register, buf, addrsize=addrsize)
+        self._i2c.writeto(address, clear_msg)
+        dist = ((buf[0] << 8) | buf[1]) - self._distance_offset
+        return dist if dist > 0 else 0
 
     def _color_for_distance(self, dist):
         '''
@@ -193,17 +261,20 @@ class RadiozoaSensor:
         Print colorized distance values from all eight sensors.
         '''
         distances = self.get_distances()
-        msg = "["
+        _color = self._color_for_distance
+        _reset = Style.RESET_ALL
+        _last  = len(distances) - 1
+        parts = ["["]
         for i, dist in enumerate(distances):
-            color = self._color_for_distance(dist)
+            color = _color(dist)
             if dist is not None and dist > 0:
-                msg += " {}{:>4}mm{}".format(color, dist, Style.RESET_ALL)
+                parts.append(" {}{:>4}mm{}".format(color, dist, _reset))
             else:
-                msg += " {}None{}".format(color, Style.RESET_ALL)
-            if i < len(distances) - 1:
-                msg += ","
-        msg += " ]"
-        print(msg)
+                parts.append(" {}None{}".format(color, _reset))
+            if i < _last:
+                parts.append(",")
+        parts.append(" ]")
+        print("".join(parts))
 
     def close(self):
         '''
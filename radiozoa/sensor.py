@@ -10,8 +10,11 @@
 # modified: 2026-02-18
 
 import micropython
+from micropython import const
 import asyncio
 import time
+import struct
+from array import array
 from machine import Timer
 from colorama import Fore, Style
 
@@ -21,9 +24,52 @@ from cardinal import Cardinal, NORTH
 from message_util import pack_message
 from exceptions import IllegalStateError
 
+_OUT_OF_RANGE = const(9999)
+_SENSOR_COUNT = const(8)
+_MIN_MM       = const(50)
+_MAX_SHORT_MM = const(1000)
+_MAX_LONG_MM  = const(4000)
+_POLL_MS      = const(50) # 50 = 20Hz
+
+@micropython.viper
+def _hue_to_rgb(h: int) -> int:
+    '''
+    Integer HSV to RGB conversion with saturation and value fixed at 1.0,
+    for a hue scaled by 256 (i.e., 0-360 degrees as 0-92160). Returns the
+    color packed as 0xRRGGBB.
+    '''
+    sector = h // 15360 # 60 * 256
+    f = (h % 15360) * 255 // 15360
+    if sector == 0:
+        return 0xFF0000 | (f << 8)
+    elif sector == 1:
+        return ((255 - f) << 16) | 0x00FF00
+    elif sector == 2:
+        return 0x00FF00 | f
+    elif sector == 3:
+        return ((255 - f) << 8) | 0x0000FF
+    elif sector == 4:
+        return (f << 16) | 0x0000FF
+    else:
+        return 0xFF0000 | (255 - f)
+
+@micropython.viper
+def _itoa4(v: int, buf: ptr8, offset: int):
+    '''
+    Writes v as four zero-padded ASCII digits into buf at offset, clamped to 9999.
+    '''
+    if v > 9999:
+        v = 9999
+    buf[offset + 3] = 48 + v % 10
+    v //= 10
+    buf[offset + 2] = 48 + v % 10
+    v //= 10
+    buf[offset + 1] = 48 + v % 10
+    buf[offset] = 48 + v // 10
+
 class Sensor:
-    OUT_OF_RANGE = 9999
-    SENSOR_COUNT = 8
+    OUT_OF_RANGE = _OUT_OF_RANGE
+    SENSOR_COUNT = _SENSOR_COUNT
     
     def __init__(self, controller=None, level=Level.INFO):
         if controller is None:
@@ -32,17 +78,35 @@ class Sensor:
         self._controller = controller
         self._radiozoa = self._controller.radiozoa
         self._ring = self._controller.ring
-        self._min_distance_mm = 50 
-        self._max_short_range_distance_mm = 1000
-        self._max_long_range_distance_mm  = 4000
+        self._min_distance_mm = _MIN_MM
+        self._max_short_range_distance_mm = _MAX_SHORT_MM
+        self._max_long_range_distance_mm  = _MAX_LONG_MM
         self._enabled = False
-        self._poll_delay_ms = 50 # 50 = 20Hz
+        self._poll_delay_ms = _POLL_MS
         self._return_max_range = True # return maximum range rather than out of range
-        self._distances = (Sensor.OUT_OF_RANGE,) * Sensor.SENSOR_COUNT
-#       self._distances_fmt = " ".join(str(Sensor.OUT_OF_RANGE) for _ in range(Sensor.SENSOR_COUNT)) # generator expression
-        self._distances_fmt = " ".join([str(Sensor.OUT_OF_RANGE)] * Sensor.SENSOR_COUNT) # list multiplication
-        self._distances_packed = pack_message(self._distances_fmt)
+        # preallocated buffers, updated in place by the poll loop
+        self._distances_buf = array('H', [_OUT_OF_RANGE] * _SENSOR_COUNT)
+        self._distances_fmt_buf = bytearray(b'9999 ' * _SENSOR_COUNT)[:-1] # fixed width "9999 9999 …"
+        self._pack_fmt = '<{}H'.format(_SENSOR_COUNT)
+        self._distances_binary = bytearray(2 * _SENSOR_COUNT)
         self._device_by_index  = {d.index: d for d in Device._registry}
+        # distance to color lookup tables, one RGB triple per 16mm bucket
+        _short_range = (self._max_short_range_distance_mm, self._build_color_lut(self._max_short_range_distance_mm))
+        _long_range  = (self._max_long_range_distance_mm, self._build_color_lut(self._max_long_range_distance_mm))
+        # max distance and color lut by sensor implementation, None being an unpopulated slot
+        _range_by_impl = { "VL53L0X": _short_range, "VL53L1X": _long_range, None: _long_range }
+        self._cardinals_by_index = tuple(Cardinal.from_id(i) for i in range(_SENSOR_COUNT))
+        # per-sensor (cardinal, ring pixel index, max distance, color lut) as used by the poll loop
+        _table = []
+        for index, _cardinal in enumerate(self._cardinals_by_index):
+            _impl = self._device_by_index[index].impl
+            if _impl not in _range_by_impl:
+                raise ValueError('unrecognised sensor implementation {} for {}.'.format(_impl, _cardinal.name))
+            _table.append((_cardinal, _cardinal.pixel - 1) + _range_by_impl[_impl])
+        self._sensor_table = tuple(_table)
+        # packed RGB per sensor, written to the ring in one update per poll
+        self._color_buf = bytearray(3 * _SENSOR_COUNT)
+        self._pixel_indices = tuple(row[1] for row in self._sensor_table)
         self._task = None
 
     @property
@@ -53,19 +117,43 @@ class Sensor:
     def distances(self):
         if not self._enabled:
             raise IllegalStateError('sensor not enabled')
-        return self._distances
+        return tuple(self._distances_buf)
+
+    @property
+    def distances_binary(self):
+        '''
+        The distances as little-endian unsigned 16 bit values, packed only when requested.
+        '''
+        if not self._enabled:
+            raise IllegalStateError('sensor not enabled')
+        struct.pack_into(self._pack_fmt, self._distances_binary, 0, *self._distances_buf)
+        return self._distances_binary
 
     @property
     def distances_fmt(self):
+        '''
+        The distances as fixed-width ASCII, formatted only when requested.
+        '''
         if not self._enabled:
             raise IllegalStateError('sensor not enabled')
-        return self._distances_fmt
+        self._format_distances()
+        return str(self._distances_fmt_buf, 'ascii')
 
     @property
     def distances_packed(self):
+        '''
+        The ASCII distances packed as an I2C message, built only when requested.
+        '''
         if not self._enabled:
             raise IllegalStateError('sensor not enabled')
-        return self._distances_packed
+        self._format_distances()
+        return pack_message(self._distances_fmt_buf)
+
+    def _format_distances(self):
+        _buf = self._distances_buf
+        _fmt = self._distances_fmt_buf
+        for index in range(_SENSOR_COUNT):
+            _itoa4(_buf[index], _fmt, index * 5)
 
     def enable(self):
         if not self._enabled:
@@ -94,35 +182,63 @@ class Sensor:
 
     async def _poll_loop(self):
         self._log.info('starting poll loop…')
+        _next_wake = time.ticks_ms()
         while self._enabled:
             try:
                 if self._radiozoa:
-                    self._distances = tuple(
-                        v if v is not None else Sensor.OUT_OF_RANGE
-                        for v in self._radiozoa.get_distances()
-                    )
-                    self._distances_fmt = " ".join("{:04d}".format(v) for v in self._distances)
-                    self._distances_packed = pack_message(self._distances_fmt)
-                    for index, dist in enumerate(self._distances):
-                        _cardinal = Cardinal.from_id(index)
-                        _device = self._device_by_index[index]
-                        if _device.impl == "VL53L0X":
-                            _color = self._color_for_distance(_cardinal, dist, self._max_short_range_distance_mm)
-                        elif _device.impl == "VL53L1X":
-                            _color = self._color_for_distance(_cardinal, dist, self._max_long_range_distance_mm)
-                        else:
-                            raise ValueError("unrecognised sensor type: {}".format(_device.impl))
-                        if _color is not None:
-                            self._ring.set_color(_cardinal.pixel - 1, _color)
+                    self._poll_once(await self._radiozoa.get_distances_async(self._poll_delay_ms))
                 else:
                     self._log.warning("no radiozoa: disabling…")
                     self.disable()
             except Exception as e:
-                self._log.error("{} raised in poll_loop: {}".format(type(e), e))
-            
-            await asyncio.sleep_ms(self._poll_delay_ms) 
+                if self._log.level <= Level.ERROR:
+                    self._log.error("{} raised in poll_loop: {}".format(type(e), e))
+            # sleep until the next period, rather than for a full delay after the work
+            _next_wake = time.ticks_add(_next_wake, self._poll_delay_ms)
+            _delta = time.ticks_diff(_next_wake, time.ticks_ms())
+            if _delta > 0:
+                await asyncio.sleep_ms(_delta)
+            else:
+                # overran the period: restart the schedule from now rather than catching up
+                _next_wake = time.ticks_ms()
+                await asyncio.sleep_ms(0)
         self._log.info(Fore.MAGENTA + 'completed poll loop.')
 
+    @micropython.native
+    def _poll_once(self, raw):
+        '''
+        Updates the distance buffers from the raw sensor readings and sets the
+        ring colors. Exceptions are handled by the calling poll loop.
+        '''
+        _buf = self._distances_buf
+        for index in range(_SENSOR_COUNT):
+            _buf[index] = raw[index]
+        _colors = self._color_buf
+        _clamp = self._return_max_range
+        for index, (_cardinal, _pixel_index, _max_distance_mm, _lut) in enumerate(self._sensor_table):
+            _dist = _buf[index]
+            _o = index * 3
+            if _dist > _max_distance_mm:
+                if not _clamp:
+                    _colors[_o] = _colors[_o + 1] = _colors[_o + 2] = 0
+                    continue
+                _dist = _max_distance_mm
+            _i = (_dist >> 4) * 3
+            _colors[_o]     = _lut[_i]
+            _colors[_o + 1] = _lut[_i + 1]
+            _colors[_o + 2] = _lut[_i + 2]
+        self._ring.set_colors(_colors, self._pixel_indices)
+
+    def _build_color_lut(self, max_distance_mm):
+        '''
+        Returns the RGB color of each 16mm distance bucket from zero to
+        max_distance_mm, packed as consecutive bytes.
+        '''
+        _lut = bytearray(3 * ((max_distance_mm >> 4) + 1))
+        for bucket in range((max_distance_mm >> 4) + 1):
+            _lut[bucket * 3:bucket * 3 + 3] = bytes(self._color_for_distance(None, bucket << 4, max_distance_mm))
+        return bytes(_lut)
+
     def _color_for_distance(self, cardinal, distance, max_distance_mm):
         if distance is None or distance > max_distance_mm:
             if self._return_max_range:
@@ -131,32 +247,8 @@ class Sensor:
                 return (0, 0, 0)
         if distance <= self._min_distance_mm:
             return (255, 0, 0)
-        ratio = distance / max_distance_mm
-        hue = ratio * 300
-        return self._hsv_to_rgb(hue, 1.0, 1.0)
-
-    def _hsv_to_rgb(self, h, s, v):
-        if s == 0:
-            val = int(v * 255)
-            return val, val, val
-        h = h % 360
-        h_sector = h // 60
-        f = (h / 60) - h_sector
-        p = v * (1 - s)
-        q = v * (1 - s * f)
-        t = v * (1 - s * (1 - f))
-        if h_sector == 0:
-            r, g, b = v, t, p
-        elif h_sector == 1:
-            r, g, b = q, v, p
-        elif h_sector == 2:
-            r, g, b = p, v, t
-        elif h_sector == 3:
-            r, g, b = p, q, v
-        elif h_sector == 4:
-            r, g, b = t, p, v
-        else:
-            r, g, b = v, p, q
-        return int(r * 255), int(g * 255), int(b * 255)
+        # hue of ratio * 300 degrees, scaled by 256 for the integer kernel
+        _rgb = _hue_to_rgb(distance * 76800 // max_distance_mm)
+        return (_rgb >> 16) & 0xFF, (_rgb >> 8) & 0xFF, _rgb & 0xFF
 
 #EOF
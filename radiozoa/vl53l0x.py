@@ -240,6 +240,9 @@ class VL53L0X():
         )
         self._started = False
 
+    def data_ready(self):
+        return bool(self._register(_RESULT_INTERRUPT_STATUS) & 0x07)
+
     def read(self):
         if not self._started:
             self._config(
@@ -189,6 +189,12 @@ class VL53L1X:
         self._started = False
         return self._status
 
+    def data_ready(self):
+        '''
+        returns True if new ranging data is available (compatible with VL53L0X API).
+        '''
+        return self.check_for_data_ready() == 1
+
     def read(self):
         '''
         read distance in mm (compatible with VL53L0X API).
@@ -12,6 +12,7 @@
 import sys
 import time
 import asyncio
+from collections import namedtuple
 
 from i2c_slave import I2CSlave
 
@@ -81,8 +82,12 @@ BOARD_CONFIGS = {
     },
 }
 
-config = BOARD_CONFIGS[BOARD]
-print('configuring for {}…'.format(config['name']))
+_board_config = BOARD_CONFIGS[BOARD]
+# expose the selected configuration as attributes, as expected by the controllers
+_fields = tuple(_board_config.keys())
+config = namedtuple('Config', _fields)(*(_board_config[k] for k in _fields))
+del _board_config, _fields
+print('configuring for {}…'.format(config.name))
 
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
@@ -97,7 +102,7 @@ def create_controller(config):
     """
     Dynamically import and instantiate the controller class based on config.
     """
-    class_name = config['controller_class']
+    class_name = config.controller_class
     module_name = class_name.lower()
     module = __import__(module_name)
     cls = getattr(module, class_name)
@@ -120,12 +125,11 @@ def start():
     try:
         controller = create_controller(config)
         slave = I2CSlave(
-            i2c_id=config['i2c_id'],
-            scl=config['scl_pin'],
-            sda=config['sda_pin'],
-            i2c_address=config['i2c_address']
+            i2c_id=config.i2c_id,
+            scl=config.scl_pin,
+            sda=config.sda_pin,
+            i2c_address=config.i2c_address
         )
-        slave.add_callback(controller.process)
         controller.set_slave(slave)
         slave.enable()
         asyncio.run(i2c_loop(controller, slave))
@@ -133,7 +137,6 @@ def start():
     except KeyboardInterrupt:
         print('\nCtrl-C caught; exiting…')
     except Exception as e:
-        print('ERROR: {} raised in start: {}'.format(type(e), e))
         sys.print_exception(e)
     finally:
         enabled = False
@@ -34,8 +34,8 @@ class Controller:
     def __init__(self, config):
         self._startup_ms            = time.ticks_ms()
         self._config                = config
-        self._name                  = config['name']
-        self._family                = config['family']
+        self._name                  = config.name
+        self._family                = config.family
 #       print('family set to: {}'.format(self._family))
         self._slave                 = None
         # neopixel support
@@ -62,14 +62,14 @@ class Controller:
     def _create_pixel(self):
         from pixel import Pixel
 
-        _pixel_pin = self._config['pixel_pin']
+        _pixel_pin = self._config.pixel_pin
         if self._family == 'TINYS3':
             import tinys3
 
             _pixel_pin = tinys3.RGB_DATA
             tinys3.set_pixel_power(1)
-        _pixel = Pixel(pin=_pixel_pin, pixel_count=1, color_order=self._config['color_order'])
-        print('NeoPixel configured on pin {}'.format(_pixel_pin))
+        _pixel = Pixel(pin=_pixel_pin, pixel_count=1, color_order=self._config.color_order)
+        print('NeoPixel configured on pin', _pixel_pin)
         _pixel.set_color(0, COLOR_CYAN)
         time.sleep_ms(100)
         _pixel.set_color(0, COLOR_BLACK)
@@ -13,6 +13,7 @@
 
 import sys
 import time
+import asyncio
 from machine import Pin, I2CTarget
 
 from message_util import pack_message, unpack_message
@@ -31,15 +32,17 @@ class I2CSlave:
         self._sda_pin     = Pin(sda) if sda else None
         self._i2c_address = i2c_address
         if self._scl_pin is not None:
-            print('I2C slave configured with SDA on pin {}, SCL on pin {}'.format(sda, scl))
+            print('I2C slave configured with SDA on pin', sda, 'and SCL on pin', scl)
         else:
             print('I2C slave configured using configured values.')
         self._i2c = None
         self._mem_buf = bytearray(I2CSlave.MEM_LENGTH)
         self._rx_copy = bytearray(I2CSlave.MEM_LENGTH)
+        self._rx_view = memoryview(self._rx_copy) # unpacked in place, without copying
         self._callback = None
         self._new_cmd = False
         self._processing = False
+        self._flag = asyncio.ThreadSafeFlag() # set by the IRQ on receipt of a command
         # initialize with ACK
         init_msg = I2CSlave.PACKED_ACK
         for i in range(len(init_msg)):
@@ -75,32 +78,47 @@ class I2CSlave:
                 for i in range(msg_len + 2):
                     self._rx_copy[i] = self._mem_buf[i]
                 self._new_cmd = True
+                self._flag.set()
+
+    async def wait(self):
+        '''
+        Waits until the IRQ has received a new command. Commands are processed
+        by the awaiting asyncio task, so never part-way through other tasks.
+        '''
+        await self._flag.wait()
 
     def check_and_process(self):
-        if self._new_cmd and not self._processing:
-            self._new_cmd = False
-            self._processing = True
-            msg_len = self._rx_copy[0]
-            try:
-                rx_bytes = bytes(self._rx_copy[:msg_len + 2])
-                cmd = unpack_message(rx_bytes)
-                if self._callback:
-                    resp_bytes = self._callback(cmd)
-                    if not resp_bytes:
-                        resp_bytes = I2CSlave.PACKED_ACK
-                else:
+        '''
+        Processes all commands received since the last call, including any
+        that arrive while one is being processed.
+        '''
+        while self._new_cmd and not self._processing:
+            self._process_one()
+
+    def _process_one(self):
+        self._new_cmd = False
+        self._processing = True
+        msg_len = self._rx_copy[0]
+        try:
+            cmd = unpack_message(self._rx_view[:msg_len + 2])
+            if self._callback:
+                resp_bytes = self._callback(cmd)
+                if not resp_bytes:
                     resp_bytes = I2CSlave.PACKED_ACK
-            except Exception as e:
-                print("ERROR: {} raised: {} [1]".format(type(e), e))
-                resp_bytes = I2CSlave.PACKED_ERR
-            try: 
-                for i in range(len(resp_bytes)):
-                    self._mem_buf[i] = resp_bytes[i]
-                for i in range(len(resp_bytes), I2CSlave.MEM_LENGTH):
-                    self._mem_buf[i] = 0
-            except Exception as e:
-                print("ERROR: {} raised: {} [2]".format(type(e), e))
-            finally:
-                self._processing = False
+            else:
+                resp_bytes = I2CSlave.PACKED_ACK
+        except Exception as e:
+            print("ERROR: {} raised: {} [1]".format(type(e), e))
+            resp_bytes = I2CSlave.PACKED_ERR
+        try: 
+            _mem_buf = self._mem_buf
+            _resp_len = len(resp_bytes)
+            _mem_buf[:_resp_len] = resp_bytes
+            for i in range(_resp_len, I2CSlave.MEM_LENGTH):
+                _mem_buf[i] = 0
+        except Exception as e:
+            print("ERROR: {} raised: {} [2]".format(type(e), e))
+        finally:
+            self._processing = False
 
 #EOF
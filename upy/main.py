@@ -10,15 +10,18 @@
 # modified: 2026-02-11
 
 import sys
-import time
+import gc
 import asyncio
+from collections import namedtuple
+from micropython import const
 
 from i2c_slave import I2CSlave
 
 # configuration ┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
-RELOAD_MODULES = True
+RELOAD_MODULES = 'reload' in getattr(sys, 'argv', ()) # development only: pass 'reload' to re-import modules
 BOARD = 'TINYS3'  # 'TINYS3' | 'TINYFX' | 'RPI_PICO' | 'STM32F405' | 'ESP32_TINY'
+TICK_MS = const(16) # controller tick period (~60Hz)
 
 BOARD_CONFIGS = {
     'TINYS3': {
@@ -81,13 +84,17 @@ BOARD_CONFIGS = {
     },
 }
 
-config = BOARD_CONFIGS[BOARD]
-print('configuring for {}…'.format(config['name']))
+_board_config = BOARD_CONFIGS[BOARD]
+del BOARD_CONFIGS # release the unused board configurations
+# expose the selected configuration as attributes rather than string-keyed lookups
+_fields = tuple(_board_config.keys())
+config = namedtuple('Config', _fields)(*(_board_config[k] for k in _fields))
+del _board_config, _fields
+print('configuring for', config.name)
 
 # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
 if RELOAD_MODULES:
-    import gc
     for mod in ['main', 'i2c_slave', 'controller']:
         if mod in sys.modules:
             del sys.modules[mod]
@@ -97,21 +104,39 @@ def create_controller(config):
     """
     Dynamically import and instantiate the controller class based on config.
     """
-    class_name = config['controller_class']
+    class_name = config.controller_class
     module_name = class_name.lower()
     module = __import__(module_name)
     cls = getattr(module, class_name)
     return cls(config)
 
-async def i2c_loop(controller, slave):
+async def i2c_loop(slave):
+    '''
+    Processes each command as the slave's IRQ signals its receipt.
+    '''
     global enabled
-    _last_time = time.ticks_ms()
+    _wait  = slave.wait
+    _check = slave.check_and_process
     while enabled:
-        _current_time = time.ticks_ms()
-        controller.tick(time.ticks_diff(_current_time, _last_time))
-        slave.check_and_process()
-        _last_time = _current_time
-        await asyncio.sleep_ms(1)
+        await _wait()
+        _check()
+
+async def tick_loop(controller, slave):
+    '''
+    Drives the controller's timed behaviour at display refresh cadence. The
+    delta passed is the nominal period; any drift is invisible in animation.
+    '''
+    global enabled
+    _tick     = controller.tick
+    _check    = slave.check_and_process
+    _sleep_ms = asyncio.sleep_ms
+    while enabled:
+        await _sleep_ms(TICK_MS)
+        _tick(TICK_MS)
+        _check() # fallback should a command be pending without a wake
+
+async def run(controller, slave):
+    await asyncio.gather(i2c_loop(slave), tick_loop(controller, slave))
 
 def start():
     global enabled
@@ -120,20 +145,22 @@ def start():
     try:
         controller = create_controller(config)
         slave = I2CSlave(
-            i2c_id=config['i2c_id'],
-            scl=config['scl_pin'],
-            sda=config['sda_pin'],
-            i2c_address=config['i2c_address']
+            i2c_id=config.i2c_id,
+            scl=config.scl_pin,
+            sda=config.sda_pin,
+            i2c_address=config.i2c_address
         )
-        slave.add_callback(controller.process)
         controller.set_slave(slave)
         slave.enable()
-        asyncio.run(i2c_loop(controller, slave))
+        # collect the setup garbage so the loop starts from a compact heap
+        gc.collect()
+        # collect early and often rather than only on heap exhaustion, set once here
+        gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+        asyncio.run(run(controller, slave))
 
     except KeyboardInterrupt:
         print('\nCtrl-C caught; exiting…')
     except Exception as e:
-        print('ERROR: {} raised in start: {}'.format(type(e), e))
         sys.print_exception(e)
     finally:
         enabled = False
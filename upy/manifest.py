@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2020-2026 by Ichiro Furusato. All rights reserved. This file is part
+# of the Robot Operating System project, released under the MIT License. Please
+# see the LICENSE file included as part of this package.
+#
+# author:   Ichiro Furusato
+# created:  2026-02-18
+# modified: 2026-02-18
+#
+# Optional MicroPython firmware manifest freezing the slave's library modules
+# into the firmware image, so that they are executed as bytecode from flash
+# rather than compiled onto the heap at import. Build with, e.g.:
+#
+#   make BOARD=UM_TINYS3 FROZEN_MANIFEST=/path/to/upy/manifest.py
+#
+# main.py is not frozen so that its board configuration remains editable on
+# the filesystem, nor is neopixel.py, as it would collide with the port's own
+# frozen neopixel module; it must remain on the filesystem to shadow it.
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+module("colors.py")
+module("controller.py")
+module("i2c_slave.py")
+module("message_util.py")
+module("pixel.py")
+module("ringcontroller.py")
+module("stm32controller.py")
+module("tinys3.py")
+
+#EOF
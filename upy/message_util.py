@@ -59,10 +59,13 @@ def calculate_crc8(data):
 def pack_message(payload_str):
     '''
     Pack a string payload into i2c message: [length][payload_bytes][crc8]
-    payload_str: ASCII string (or convertible to bytes)
+    payload_str: ASCII string, or an ASCII bytes/bytearray used as-is
     returns: bytes object to transmit
     '''
-    payload_bytes = payload_str.encode('ascii')
+    if isinstance(payload_str, str):
+        payload_bytes = payload_str.encode('ascii')
+    else:
+        payload_bytes = bytes(payload_str)
     length = len(payload_bytes)
     if length > 255:
         raise ValueError('payload too long (max 255 bytes)')
@@ -73,6 +76,7 @@ def pack_message(payload_str):
 def unpack_message(msg_bytes):
     '''
     Unpack message from [length][payload][crc8]. Return payload string if CRC ok, else raise ValueError.
+    msg_bytes: bytes, bytearray or a memoryview of a receive buffer
     '''
     if len(msg_bytes) < 2:
         raise ValueError('message too short')
@@ -84,6 +88,6 @@ def unpack_message(msg_bytes):
     crc_check = calculate_crc8(msg_bytes[:-1])
     if crc_in_msg != crc_check:
         raise ValueError('crc8 mismatch')
-    return payload_bytes.decode('ascii')
+    return str(payload_bytes, 'ascii')
 
 #EOF
@@ -62,6 +62,29 @@ class Pixel:
             self._neopixel[_index] = color
         self._neopixel.write()
 
+    def set_colors(self, colors, indices=None):
+        '''
+        Sets several pixels from a buffer of packed RGB triples with a single
+        write. If provided, indices maps each triple to its pixel index.
+        '''
+        _neopixel = self._neopixel
+        for i in range(len(colors) // 3):
+            _offset = i * 3
+            _neopixel[i if indices is None else indices[i]] = (colors[_offset], colors[_offset + 1], colors[_offset + 2])
+        _neopixel.write()
+
+    def clear(self, index=0):
+        '''
+        Turns off the pixel at index. This writes the NeoPixel buffer directly and
+        does not allocate, so may be called from a hard interrupt handler.
+        '''
+        _neopixel = self._neopixel
+        _offset = index * _neopixel.bpp
+        _buf = _neopixel.buf
+        for i in range(_neopixel.bpp):
+            _buf[_offset + i] = 0
+        _neopixel.write()
+
     def off(self):
         for i in range(self._pixel_count):
             self._neopixel[i] = (0, 0, 0)
@@ -11,7 +11,7 @@
 import sys
 import time
 import math, random
-from pixel_state import PixelState
+from array import array
 from controller import Controller
 #from stm32controller import STM32Controller
 from colors import *
@@ -20,11 +20,11 @@ from pixel import Pixel
 #class RingController(STM32Controller):
 class RingController(Controller):
     '''
-    An implementation connected to a 24 pixel NeoPixel ring.
+    An implementation connected to a NeoPixel ring of config.ring_count pixels.
     '''
     def __init__(self, config):
         super().__init__(config)
-        self._ring_count = config['ring_count']
+        self._ring_count = config.ring_count
         if self._ring_count is None:
             raise ValueError('ring count is undefined.')
         elif self._ring_count == 0:
@@ -35,7 +35,13 @@ class RingController(Controller):
         self._rotate_direction = 1 # 1 or -1
         self._enable_rotate    = False
         self._rotate_pending   = False # flag for deferred execution
-        self._ring_model = [PixelState() for _ in range(self._ring_count)]
+        # ring model as parallel arrays indexed by pixel: base and current RGB triples,
+        # pulse phase and whether the pixel has a (non-black) base color
+        self._base_rgb  = bytearray(3 * self._ring_count)
+        self._rgb       = bytearray(3 * self._ring_count)
+        self._phase     = array('f', [0.0] * self._ring_count)
+        self._active    = bytearray(self._ring_count)
+        self._rotated   = bytearray(3 * self._ring_count) # current RGB in ring order
         # theme
         self._enable_theme     = False
         self._pulse_steps      = 40
@@ -75,16 +81,16 @@ class RingController(Controller):
     def _create_ring(self):
         from pixel import Pixel
 
-        _ring_pin   = self._config['ring_pin']
-        _ring = Pixel(pin=_ring_pin, pixel_count=self._ring_count, color_order=self._config['color_order'])
-        print('NeoPixel ring with {} pixels configured on pin {}'.format(self._ring_count, _ring_pin))
+        _ring_pin   = self._config.ring_pin
+        _ring = Pixel(pin=_ring_pin, pixel_count=self._ring_count, color_order=self._config.color_order)
+        print('NeoPixel ring with', self._ring_count, 'pixels configured on pin', _ring_pin)
         _ring.set_color(0, COLOR_CYAN)
         time.sleep_ms(100)
         _ring.set_color(0, COLOR_BLACK)
         return _ring
 
     def _create_ring_timer(self):
-        family = self._config['family']
+        family = self._config.family
         if "STM32" in family:
             from pyb import Timer
 
@@ -101,27 +107,48 @@ class RingController(Controller):
     # ring processing ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
 
     def reset_ring(self):
-        for pixel in self._ring_model:
-            pixel.reset()
+        self._reset_model()
         self._update_ring()
 
+    def _reset_model(self):
+        for i in range(3 * self._ring_count):
+            self._base_rgb[i] = 0
+            self._rgb[i] = 0
+        for i in range(self._ring_count):
+            self._phase[i] = 0.0
+            self._active[i] = 0
+
+    def _set_model_color(self, index, color):
+        '''
+        Sets the base and current color of the ring model pixel at index.
+        '''
+        r, g, b = color.rgb
+        _offset = index * 3
+        self._base_rgb[_offset]     = self._rgb[_offset]     = r
+        self._base_rgb[_offset + 1] = self._rgb[_offset + 1] = g
+        self._base_rgb[_offset + 2] = self._rgb[_offset + 2] = b
+        self._active[index] = 1 if (r or g or b) else 0
+
     def _rotate_ring(self, shift=1):
-        if abs(shift) > 24:
+        if abs(shift) > self._ring_count:
             raise ValueError('shift value outside of bounds.')
         shift *= self._rotate_direction
-        self._ring_offset = (self._ring_offset + shift) % 24
+        self._ring_offset = (self._ring_offset + shift) % self._ring_count
         self._update_ring()
 
     def _update_ring(self):
-        for index in range(24):
-            rotated_index = (index - self._ring_offset) % 24
-            self._ring.set_color(index, self._ring_model[rotated_index].color)
+        # ring pixel index shows model pixel (index - offset), written in one update
+        _split = 3 * (self._ring_count - self._ring_offset)
+        _rgb = memoryview(self._rgb)
+        _rotated = memoryview(self._rotated)
+        _rotated[len(self._rgb) - _split:] = _rgb[:_split]
+        _rotated[:len(self._rgb) - _split] = _rgb[_split:]
+        self._ring.set_colors(self._rotated)
 
     def _set_ring_color(self, index, color):
 #       print('set ring color at {} to {}'.format(index, color))
-        actual_index = (index + self._ring_offset) % 24
-        self._ring_model[actual_index].base_color = color
-        self._ring_model[actual_index].color = color.rgb
+        actual_index = (index + self._ring_offset) % self._ring_count
+        self._set_model_color(actual_index, color)
         self._ring.set_color(index, color.rgb)
 
     def _restart_timer(self, freq=None):
@@ -159,18 +186,16 @@ class RingController(Controller):
         if palette is None:
             print("ERROR: no such palette: '{}'".format(palette_name))
             return
-        for pixel in self._ring_model:
-            pixel.reset()
-            pixel.phase = random.random()
+        self._reset_model()
+        for i in range(self._ring_count):
+            self._phase[i] = random.random()
         selected = []
-        available = list(range(24))
+        available = list(range(self._ring_count))
         for _ in range(count):
             idx = random.randrange(len(available))
             selected.append(available.pop(idx))
         for i in selected:
-            color = random.choice(palette)
-            self._ring_model[i]. base_color = color
-            self._ring_model[i].color = color.rgb
+            self._set_model_color(i, random.choice(palette))
         self._update_ring()
 
     def _init_theme(self, reset=False):
@@ -180,31 +205,35 @@ class RingController(Controller):
             self.reset_ring()
             existing_count = 0
         else:
-            existing_count = sum(1 for p in self._ring_model if p.is_active())
+            existing_count = sum(self._active)
         new_pixels_needed = max(0, self._theme_target_pixels - existing_count)
         available_colors = [c for c in Color.all_colors() if c != COLOR_BLACK]
         if new_pixels_needed > 0:
-            empty_positions = [i for i in range(24) if not self._ring_model[i].is_active()]
+            empty_positions = [i for i in range(self._ring_count) if not self._active[i]]
             for _ in range(new_pixels_needed):
                 if not empty_positions:
                     break
                 idx = random.randrange(len(empty_positions))
                 pos = empty_positions.pop(idx)
-                color = random.choice(available_colors)
-                self._ring_model[pos].base_color = color
-                self._ring_model[pos].color = color.rgb
-                self._ring_model[pos].phase = random.random()
+                self._set_model_color(pos, random.choice(available_colors))
+                self._phase[pos] = random.random()
         self._update_ring()
 
     def _theme(self):
-        for index in range(24):
-            pixel = self._ring_model[index]
-            if not pixel.is_active():
+        _active   = self._active
+        _phase    = self._phase
+        _base_rgb = self._base_rgb
+        _rgb      = self._rgb
+        _step     = 1.0 / self._pulse_steps
+        for index in range(self._ring_count):
+            if not _active[index]:
                 continue
-            pixel.phase = (pixel.phase + 1.0 / self._pulse_steps) % 1.0
-            brightness = (math.sin(pixel.phase * 2 * math.pi) + 1) / 2
-            r, g, b = pixel.base_color.rgb
-            pixel.color = (int(r * brightness), int(g * brightness), int(b * brightness))
+            _phase[index] = (_phase[index] + _step) % 1.0
+            brightness = (math.sin(_phase[index] * 2 * math.pi) + 1) / 2
+            _offset = index * 3
+            _rgb[_offset]     = int(_base_rgb[_offset] * brightness)
+            _rgb[_offset + 1] = int(_base_rgb[_offset + 1] * brightness)
+            _rgb[_offset + 2] = int(_base_rgb[_offset + 2] * brightness)
         self._update_ring()
 
     # ┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈┈
@@ -250,7 +279,7 @@ class RingController(Controller):
                         return Controller._PACKED_ACK, COLOR_DARK_GREEN
                 else:
                     index = int(arg1) - 1
-                    if 0 <= index <= 23:
+                    if 0 <= index < self._ring_count:
                         color = self._get_color(arg2, arg3)
                         if color:
                             self._set_ring_color(index, color)
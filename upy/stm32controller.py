@@ -8,8 +8,13 @@
 # created:  2026-02-09
 # modified: 2026-02-17
 
+import time
+from micropython import const
 from controller import Controller
 from colors import *
+from pixel import Pixel
+
+_DEBUG = const(0) # 1 to print pre- and post-process arguments; compiled out when 0
 
 class STM32Controller(Controller):
     '''
@@ -18,15 +23,12 @@ class STM32Controller(Controller):
     '''
     def __init__(self, config):
         super().__init__(config)
-        self._pixel_off_pending = False
         # ready
 
     def _create_pixel(self):
-        from pixel import Pixel
-
-        _pixel_pin = self._config['pixel_pin']
-        _pixel = Pixel(pin=_pixel_pin, pixel_count=1, color_order=self._config['color_order'])
-        print('NeoPixel configured on pin {}'.format(_pixel_pin))
+        _pixel_pin = self._config.pixel_pin
+        _pixel = Pixel(pin=_pixel_pin, pixel_count=1, color_order=self._config.color_order)
+        print('NeoPixel configured on pin', _pixel_pin)
         _pixel.set_color(0, COLOR_CYAN)
         time.sleep_ms(100)
         _pixel.set_color(0, COLOR_BLACK)
@@ -39,27 +41,21 @@ class STM32Controller(Controller):
         self._pixel_timer.init(freq=self._pixel_timer_freq_hz, callback=self._timer_irq)
 
     def _timer_irq(self, timer):
-        self._pixel_off_pending = True
+        self._led_off()
         self._pixel_timer.deinit()  # stop after first trigger
 
     def _led_off(self, timer=None):
-        # override to use deferred execution via flag
-        self._pixel_off_pending = True
-
-    def tick(self, delta_ms):
-        # handle deferred pixel updates first
-        if self._pixel_off_pending:
-            self._pixel_off_pending = False
-            self._pixel.set_color(0, COLOR_BLACK)
-        # then do normal tick processing
-        super().tick(delta_ms)
+        # override as called from the hard timer IRQ: Pixel.clear() does not allocate
+        if self._pixel:
+            self._pixel.clear(0)
 
     def pre_process(self, cmd, arg0, arg1, arg2, arg3, arg4):
         '''
         Pre-process the arguments, returning a response and color if a match occurs.
         Such a match precludes further processing.
         '''
-#       print("pre-process command '{}' with arg0: '{}'; arg1: '{}'; arg2: '{}'; arg3: '{}'; arg4: '{}'".format(cmd, arg0, arg1, arg2, arg3, arg4))
+        if _DEBUG:
+            print("pre-process command '{}' with arg0: '{}'; arg1: '{}'; arg2: '{}'; arg3: '{}'; arg4: '{}'".format(cmd, arg0, arg1, arg2, arg3, arg4))
         if arg0 == "__extend_here__":
             return None, None
         else:
@@ -69,7 +65,8 @@ class STM32Controller(Controller):
         '''
         Post-process the arguments, returning a NACK and color if no match on arg0 occurs.
         '''
-#       print("post-process command '{}' with arg0: '{}'; arg1: '{}'; arg2: '{}'; arg3: '{}'; arg4: '{}'".format(cmd, arg0, arg1, arg2, arg3, arg4))
+        if _DEBUG:
+            print("post-process command '{}' with arg0: '{}'; arg1: '{}'; arg2: '{}'; arg3: '{}'; arg4: '{}'".format(cmd, arg0, arg1, arg2, arg3, arg4))
         if arg0 == "__extend_here__":
             return None, None
         else: